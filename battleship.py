@@ -7,6 +7,10 @@ import bge
 GRID_WIDTH = 500
 GRID_HEIGHT = 500
 
+# The labels along the top and down the side of a grid.
+_COL_LABELS = tuple(str(i) for i in range(1, 11))
+_ROW_LABELS = tuple(chr(ord('A') + i) for i in range(10))
+
 
 class GameFrame(tk.Frame):
     def __init__(self, *args, **kwargs):
@@ -86,79 +90,128 @@ class Grid(tk.Canvas):
 
         self._draw_gridlines()
 
-        self._highlighted = None
+        # The highlight is a single rectangle that is moved from cell to
+        # cell, and hidden when no cell is highlighted.
+        self._highlight = self.create_rectangle(0, 0, 0, 0, outline='red', width=2, state=tk.HIDDEN)
+        # The row, col indices of the highlighted cell.
+        self._highlighted_coords = None
+        # The row, col indices waiting to be highlighted when Tk is next idle.
+        self._pending_coords = None
 
         def highlight(event):
-            coords = self._row_col(event.x, event.y)
-            if coords is not None:
-                self._clear_highlight()
-                self._highlight_cell(*coords)
+            # Motion events fire far more often than the cursor changes cell,
+            # so only schedule a redraw when the target cell changes and let
+            # the latest event win when several arrive before Tk is idle.
+            coords = self._cell_index(event.x, event.y)
+            if coords is None:
+                return
+
+            if self._pending_coords is None:
+                if coords == self._highlighted_coords:
+                    return
+                self.after_idle(self._update_highlight)
+
+            self._pending_coords = coords
 
         if mouse_highlight:
             self.bind('<Motion>', highlight)
+            self.bind('<Leave>', lambda event: self._clear_highlight())
 
         # The on-click handler takes two args for row and col.
         self.on_cell_click: callable = None
 
         def click(event):
             if self.on_cell_click is not None:
-                coords = self._row_col(event.x, event.y)
+                coords = self._cell_index(event.x, event.y)
                 if coords is not None:
-                    self.on_cell_click(*coords)
+                    row, col = coords
+                    self.on_cell_click(_ROW_LABELS[row], col + 1)
 
         self.bind('<ButtonRelease-1>', click)
 
     def _draw_gridlines(self):
-        # Draw the vertical grid lines
-        for i in range(1, 11):
-            x = self.cell_length * i
-            width = 1 if i != 1 else 3
-            mid = self.cell_length // 2
-            self.create_line(x, 0, x, GRID_HEIGHT, fill='silver', width=width)
-            self.create_text((x + mid, mid), text=f'{i}', fill='#f2f2f2')
-
-        row_char = ord('A') - 1
-
-        # Draw the horizontal grid lines
-        for i in range(1, 11):
-            y = self.cell_length * i
-            width = 1 if i != 1 else 3
-            mid = self.cell_length // 2
-            self.create_line(0, y, GRID_WIDTH, y, fill='silver', width=width)
-            self.create_text((mid, y + mid), text=f'{chr(row_char + i)}', fill='#f2f2f2')
-
-    def _row_col(self, x, y):
-        """Get the row, col for the specified x, y position or None if x, y invalid."""
-        row = chr(int((ord('A') - 1) + y // self.cell_length))
-        col = int(x // self.cell_length)
-
-        if 10 >= col >= 1 and 'J' >= row >= 'A':
+        step = self.cell_length
+        mid = step // 2
+
+        # The grid lines are drawn as polylines which snake back and forth
+        # across the canvas, so that all lines of the same width take a
+        # single canvas item. The segments joining one line to the next
+        # run just outside the canvas, so they are never visible.
+        top, left = -10, -10
+        bottom, right = GRID_HEIGHT + 10, GRID_WIDTH + 10
+
+        # The thick lines along the top and left edges of the grid
+        self.create_line(
+            step, top, step, bottom, left, bottom, left, step, right, step,
+            fill='silver', width=3,
+        )
+
+        points = []
+
+        # The vertical grid lines
+        for i in range(2, 11):
+            x = step * i
+            start, end = (top, bottom) if i % 2 == 0 else (bottom, top)
+            points.extend((x, start, x, end))
+
+        # Join the last vertical line to the first horizontal line
+        points.extend((left, bottom))
+
+        # The horizontal grid lines
+        for i in range(2, 11):
+            y = step * i
+            start, end = (left, right) if i % 2 == 0 else (right, left)
+            points.extend((start, y, end, y))
+
+        self.create_line(*points, fill='silver', width=1)
+
+        # The column and row labels
+        for i, (col_label, row_label) in enumerate(zip(_COL_LABELS, _ROW_LABELS), start=1):
+            offset = step * i + mid
+            self.create_text((offset, mid), text=col_label, fill='#f2f2f2')
+            self.create_text((mid, offset), text=row_label, fill='#f2f2f2')
+
+    def _cell_index(self, x, y):
+        """Get the zero-based row, col indices of the cell at the specified x, y
+        position or None if x, y invalid."""
+        # The first row and column of the canvas hold the labels
+        row = int(y // self.cell_length) - 1
+        col = int(x // self.cell_length) - 1
+
+        if 0 <= row < 10 and 0 <= col < 10:
             return row, col
 
         return None
 
+    def _update_highlight(self):
+        """Move the highlight to the most recent pending cell."""
+        coords, self._pending_coords = self._pending_coords, None
+
+        if coords is not None and coords != self._highlighted_coords:
+            self._highlight_cell(*coords)
+
     def _highlight_cell(self, row, col):
-        """Highlight the cell specified by row, col."""
-        cell = self._cell(row, col)
-        self._highlighted = self.create_rectangle(*cell, outline='red', width=2)
+        """Highlight the cell specified by row, col indices."""
+        # This runs as the pointer moves between cells, so call Tk directly
+        # rather than through the Canvas wrappers and their argument handling.
+        self.tk.call(self._w, 'coords', self._highlight, *self._cell(row, col))
+        self.tk.call(self._w, 'itemconfigure', self._highlight, '-state', tk.NORMAL)
+        self._highlighted_coords = row, col
 
     def _clear_highlight(self):
         """Clear any existing cell highlight."""
-        if self._highlighted is not None:
-            self.delete(self._highlighted)
-            self._highlighted = None
-
-    def _cell(self, row, col):
-        """Return the bbox of the cell with the specified row and col."""
-        row_map = {}
-        row_char = ord('A')
+        # Drop any pending highlight too, so that an update already queued
+        # for when Tk is idle doesn't bring the highlight back.
+        self._pending_coords = None
 
-        for i in range(1, 11):
-            row_map[chr(row_char)] = i
-            row_char += 1
+        if self._highlighted_coords is not None:
+            self.tk.call(self._w, 'itemconfigure', self._highlight, '-state', tk.HIDDEN)
+            self._highlighted_coords = None
 
-        x1 = col * self.cell_length
-        y1 = row_map[row] * self.cell_length
+    def _cell(self, row, col):
+        """Return the bbox of the cell with the specified row and col indices."""
+        x1 = (col + 1) * self.cell_length
+        y1 = (row + 1) * self.cell_length
         x2 = x1 + self.cell_length
         y2 = y1 + self.cell_length
 
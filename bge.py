@@ -46,8 +46,8 @@ False
 False
 """
 from __future__ import annotations
-import itertools
 import random
+from collections.abc import Iterable, Iterator, MutableMapping, MutableSet, Sequence
 from typing import Optional, Union
 
 Coord = tuple[str, int]
@@ -67,6 +67,7 @@ class Game:
 
     After creating their grids, players call shoot() in turn.
     """
+    __slots__ = ('players',)
 
     def __init__(self):
         self.players: dict[str, Grid] = {}
@@ -94,7 +95,7 @@ class Game:
 
     def shoot(self,
               target_player: str,
-              target_coord: Union[Coord, AUTO] = AUTO) -> tuple[bool, set[Ship], Grid]:
+              target_coord: Union[Coord, AUTO] = AUTO) -> tuple[bool, frozenset[Ship], Grid]:
         """Make a shot on the specified player's grid.
 
         The value of the target coordinate should be specified as a tuple
@@ -109,7 +110,7 @@ class Game:
         Returns:
             a 3-tuple containing:
                 a boolean for a hit/miss
-                a set containing the remaning ships afloat
+                a frozenset containing the remaning ships afloat
                 the target player's Grid instance
         """
         if not self.players:
@@ -118,21 +119,21 @@ class Game:
         if len(self.players) == 1:
             self._create_player2()
 
-        if not all(len(g.ships) == len(all_ships) for g in self.players.values()):
+        if not all(len(g.ships) == _NUM_SHIPS for g in self.players.values()):
             raise RuntimeError('Not all ships have been positioned')
 
         try:
             target_grid = self.players[target_player]
         except KeyError:
             raise KeyError(
-                f"No such player '{target_player}' - valid players are {list(self.players.keys())}")
-
-        if target_coord == AUTO:
-            target_coord = self._compute_coord(target_grid)
-        elif target_coord not in target_grid:
-            raise InvalidCoordinate(f'Invalid grid coordinate {target_coord}')
-
-        hit = target_grid.receive_shot(target_coord)
+                f"No such player '{target_player}' - valid players are {list(self.players)}")
+
+        if target_coord is AUTO:
+            # The computed coordinate is known to be valid, so the shot
+            # skips receive_shot()'s checks.
+            hit = target_grid._receive_shot(self._compute_coord(target_grid))
+        else:
+            hit = target_grid.receive_shot(target_coord)
         remaining_ships = target_grid.ships_afloat()
 
         return hit, remaining_ships, target_grid
@@ -141,86 +142,58 @@ class Game:
         """Create player 2 when only one human player."""
         grid = self.create_grid(COMPUTER)
 
-        ships = set(all_ships)
-
-        while ships:
-            ship = ships.pop()
-
-            # Randomly position each ship on the grid
-            while True:
-                # Create a random start coordinate
-                row = random.choice([chr(c) for c in range(ord('A'), ord('A') + grid.size)])
-                col = random.choice(range(1, 11))
-
-                # Randomly select the direction to generate the coordinates in
-                row_inc, col_inc = random.choice(((0, 1), (1, 0)))
-
-                # Generate the ship coordinates
-                coords = [
-                    (chr(ord(row) + (i * row_inc)), col + (i * col_inc))
-                    for i in range(ship.size)
-                ]
-
-                try:
-                    grid.add_ship(ship, *coords)
-                    break
-                except InvalidCoordinate:
-                    continue
+        for ship in all_ships:
+            # Randomly position each ship in one of the positions that
+            # doesn't overlap an already positioned ship. The positions
+            # are known to be valid, so add_ship()'s checks are skipped.
+            placements = [mask for mask in _PLACEMENTS[ship.size] if not mask & grid._ship_bits]
+            grid._place_ship(ship, list(_bit_indices(random.choice(placements))))
 
-    def _compute_coord(self, grid):
-        # Create a set of all grid coordinates
-        all_coords = {
-            (chr(row), col)
-            for row in range(ord('A'), ord('A') + grid.size)
-            for col in range(1, 11)
-        }
+    def _compute_coord(self, grid) -> int:
+        """Compute the (packed) coordinate of the next shot at a grid."""
+        # Work with packed coordinates, so that neighbouring cells can be
+        # found arithmetically: cells in the same row are 1 apart and cells
+        # in the same column are grid.size apart.
+        size = grid.size
 
         # Default to randomly targeting a cell that hasn't been previously shot at
-        coord = random.sample(list(all_coords - grid.shots), 1)[0]
-        ship_hits = ()
+        targets = _ALL_BITS & ~grid._shot_bits
 
         for ship in grid.ships_afloat():
-            ship_hits = set(grid.ships[ship]) & grid.shots
+            ship_hits = list(_bit_indices(grid._ship_masks[ship] & grid._shot_bits))
 
             if ship_hits:
                 # This ship has been shot but not yet sunk
                 break
+        else:
+            ship_hits = []
+
+        if ship_hits:
+            first, last = ship_hits[0], ship_hits[-1]
+
+            if len(ship_hits) == 1:
+                # A single hit, so target the adjacent cells in the row and column
+                steps = (1, size)
+            elif last - first < size:
+                # Hits are in a row, so target the row from either end of the hits
+                steps = (1,)
+            else:
+                # Hits are in a column, so target the column from either end of the hits
+                steps = (size,)
+
+            line = _bitmask(
+                i
+                for step in steps
+                for i in range(first - step, last + step + 1, step)
+                if 0 <= i < size * size and (step == size or i // size == first // size)
+            )
 
-        if len(ship_hits) == 1:
-            # This ship has a single hit, so target an adjacent cell
-            row, col = ship_hits.pop()
-            increments = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-            while True:
-                row_inc, col_inc = random.choice(increments)
-                increments.remove((row_inc, col_inc))
-                coord = (chr(ord(row) + (1 * row_inc)), col + (1 * col_inc))
-
-                if coord in grid and coord not in grid.shots:
-                    break
-
-        elif len(ship_hits) > 1:
-            # Ship has multiple hits - line the hits up
-            ship_hits = sorted(ship_hits)
-
-            # Figure out whether they're in a row or a column
-            row_diff = ord(ship_hits[1][0]) - ord(ship_hits[0][0])
-            col_diff = ship_hits[1][1] - ship_hits[0][1]
-
-            while True:
-                if row_diff == 0:
-                    # Hits are in a row so choose a cell either end
-                    coord = ship_hits[0][0], random.choice((ship_hits[0][1] - 1, ship_hits[-1][1] + 1))
-                elif col_diff == 0:
-                    # Hits are in a column so choose a cell top or bottom
-                    coord = random.choice(
-                        (chr(ord(ship_hits[0][0]) - 1), chr(ord(ship_hits[-1][0]) + 1))
-                    ), ship_hits[0][1]
-
-                if coord in grid and coord not in grid.shots:
-                    break
+            # Target any cell along the line not previously shot at, which
+            # includes gaps between hits as well as the cells either end.
+            if targets & line:
+                targets &= line
 
-        return coord
+        return random.choice(list(_bit_indices(targets)))
 
 
 class Grid:
@@ -234,16 +207,59 @@ class Grid:
     An opponent makes a shot on the grid by calling it's receive_shot()
     method and passing in the shot coordinates.
     """
+    __slots__ = (
+        'ships',
+        'shots',
+        '_positions',
+        '_ship_bits',
+        '_ship_masks',
+        '_shot_bits',
+        '_cell_owner',
+        '_afloat',
+        '_ship_remaining',
+        '_matrix',
+    )
+
     # The number of spaces making up the width and height of the grid.
     size: int = 10
 
     def __init__(self):
         # The locations of the ships on the grid.
         # A ship's location consists of the grid coordinates the ship fills.
-        self.ships: dict[Ship, tuple[Coord]] = {}
+        self._positions: dict[Ship, tuple[Coord, ...]] = {}
+
+        # The locations of the ships, as a mapping backed by the grid's state.
+        self.ships: _Ships = _Ships(self)
+
+        # Internally, coordinates are packed into their index in the
+        # row-major flattened grid - see _COORD_TO_INDEX. Sets of coordinates
+        # are held as bitmasks, with the bit at each packed coordinate set.
+
+        # The coordinates taken up by all ships, and by each ship.
+        self._ship_bits: int = 0
+        self._ship_masks: dict[Ship, int] = {}
+
+        # The coordinates that have been shot at.
+        self._shot_bits: int = 0
+
+        # The shots that have been targeted at this grid to date, as a set of
+        # coordinates backed by the bitmask above.
+        self.shots: _Shots = _Shots(self)
 
-        # The shots that have been targeted at this grid to date.
-        self.shots: set[Coord] = set()
+        # The ships not yet sunk and the number of hits each can still take,
+        # maintained as shots are received. The ships not yet sunk are held
+        # in a frozenset that is only replaced when a ship is positioned or
+        # sunk, so that ships_afloat() can return it without copying.
+        self._afloat: frozenset[Ship] = frozenset()
+        self._ship_remaining: dict[Ship, int] = {}
+
+        # The ship taking up each cell, or None if the cell is empty,
+        # flattened row by row and indexed by packed coordinate.
+        self._cell_owner: list[Optional[Ship]] = [None] * (self.size * self.size)
+
+        # The matrix reported by as_matrix(), updated a cell at a time as
+        # shots are received.
+        self._matrix: list[list[Optional[bool]]] = [[None] * self.size for _ in range(self.size)]
 
     def add_ship(self, ship: Ship, *coords: Coord) -> None:
         """Add a ship to the grid checking that the position is valid based on the
@@ -264,25 +280,79 @@ class Grid:
                 f"the size of the ship '{ship}'"
             )
 
-        rows, cols = zip(*coords)
-
-        if len(set(rows)) == 1:
-            # Row is the same, so check cols are consecutive
-            if sorted(cols) != list(range(min(cols), max(cols) + 1)):
-                raise InvalidCoordinate(f"Coordinate columns are not consecutive for '{ship}'")
-        elif len(set(cols)) == 1:
-            # Col is the same, so check rows are consecutive
-            rows = sorted(ord(r) for r in rows)
-            if rows != list(range(min(rows), max(rows) + 1)):
-                raise InvalidCoordinate(f"Coordinate rows are not consecutive for '{ship}'")
-
-        for coord in coords:
-            if coord not in self or coord in self._all_ship_coords():
-                # Ship extends off the grid or uses the same coordinate as
-                # an already positioned ship.
-                raise InvalidCoordinate(f"Invalid position for '{ship}'")
-
-        self.ships[ship] = coords
+        indices = [_COORD_TO_INDEX.get(coord) for coord in coords]
+
+        if None in indices:
+            # Ship extends off the grid
+            raise InvalidCoordinate(f"Invalid position for '{ship}'")
+
+        mask = _bitmask(indices)
+        first, last = (mask & -mask).bit_length() - 1, mask.bit_length() - 1
+
+        # Cells in a row are 1 apart and cells in a column are the grid size
+        # apart, so the spread of the coordinates determines the direction
+        # they must run in. They're consecutive when their mask is exactly
+        # that of the cells stepping that way from the first, without
+        # wrapping rows. Repeated coordinates leave bits missing from the mask.
+        step = 1 if last - first < self.size else self.size
+        expected = ((1 << step * len(indices)) - 1) // ((1 << step) - 1) << first
+
+        if mask != expected or (step == 1 and first // self.size != last // self.size):
+            raise InvalidCoordinate(f"Coordinates are not consecutive for '{ship}'")
+
+        if mask & self._ship_bits:
+            # Ship uses the same coordinate as an already positioned ship
+            raise InvalidCoordinate(f"Invalid position for '{ship}'")
+
+        self._place_ship(ship, indices)
+
+    def _place_ship(self, ship: Ship, indices: Sequence[int]) -> None:
+        """Position a ship at the specified packed coordinates, without
+        checking that the position is valid."""
+        if ship in self._positions:
+            # The ship is being repositioned
+            self._release_ship(ship)
+
+        mask = _bitmask(indices)
+        self._positions[ship] = tuple(_INDEX_TO_COORD[index] for index in indices)
+        self._ship_masks[ship] = mask
+        self._ship_bits |= mask
+        for index in indices:
+            self._cell_owner[index] = ship
+
+        # Shots previously made at the new coordinates are now hits, and
+        # count against the ship.
+        hits = list(_bit_indices(mask & self._shot_bits))
+        for index in hits:
+            row, col = divmod(index, self.size)
+            self._matrix[row][col] = True
+        self._ship_remaining[ship] = ship.size - len(hits)
+
+        if self._ship_remaining[ship]:
+            self._afloat |= {ship}
+        else:
+            self._afloat -= {ship}
+
+    def _remove_ship(self, ship: Ship) -> None:
+        """Remove a positioned ship from the grid."""
+        self._release_ship(ship)
+        del self._positions[ship]
+        del self._ship_masks[ship]
+        del self._ship_remaining[ship]
+        self._afloat -= {ship}
+
+    def _release_ship(self, ship: Ship) -> None:
+        """Release the coordinates taken up by a positioned ship. Any shots
+        previously made there are now misses."""
+        mask = self._ship_masks[ship]
+        self._ship_bits &= ~mask
+
+        for index in _bit_indices(mask):
+            self._cell_owner[index] = None
+
+        for index in _bit_indices(mask & self._shot_bits):
+            row, col = divmod(index, self.size)
+            self._matrix[row][col] = False
 
     def receive_shot(self, coord: Coord) -> bool:
         """Receive a shot from the opponent player and return whether
@@ -292,13 +362,50 @@ class Grid:
             coord: The coordinate of the shot.
         Returns:
             True if the shot was a hit, False if it was a miss.
+        Raises:
+            InvalidCoordinate: if the coordinate is off the grid or has
+                previously been shot at.
         """
-        if coord in self.shots:
+        index = _COORD_TO_INDEX.get(coord)
+
+        if index is None:
+            raise InvalidCoordinate(f'Invalid grid coordinate {coord}')
+
+        if self._shot_bits & (1 << index):
             raise InvalidCoordinate(f'Shot at {coord} has previously been made')
 
-        self.shots.add(coord)
+        return self._receive_shot(index)
+
+    def _receive_shot(self, index: int) -> bool:
+        """Receive a shot at the specified packed coordinate, without
+        checking that the shot is valid."""
+        self._shot_bits |= 1 << index
+        ship = self._cell_owner[index]
+        hit = ship is not None
+
+        if hit:
+            self._ship_remaining[ship] -= 1
+
+            if not self._ship_remaining[ship]:
+                self._afloat -= {ship}
+
+        row, col = divmod(index, self.size)
+        self._matrix[row][col] = hit
+
+        return hit
 
-        return coord in self._all_ship_coords()
+    def _remove_shot(self, index: int) -> None:
+        """Remove a previously received shot at the specified packed
+        coordinate, without checking that the shot was made."""
+        self._shot_bits &= ~(1 << index)
+        ship = self._cell_owner[index]
+
+        if ship is not None:
+            self._ship_remaining[ship] += 1
+            self._afloat |= {ship}
+
+        row, col = divmod(index, self.size)
+        self._matrix[row][col] = None
 
     def as_matrix(self) -> list[list[Optional[bool]]]:
         """Return a matrix of the current state of the grid.
@@ -310,50 +417,154 @@ class Grid:
         Returns:
             the matrix as a list of lists.
         """
-        matrix = []
+        # The matrix is kept up to date by receive_shot(), so it only
+        # needs copying, leaving the caller free to modify the copy.
+        return [row.copy() for row in self._matrix]
 
-        for i in range(self.size):
-            row = []
+    def ships_afloat(self) -> frozenset[Ship]:
+        """Return the ships that have not yet been sunk.
 
-            for j in range(self.size):
-                coord = (chr(ord('A') + i), j + 1)
-                if coord in self.shots:
-                    row.append(coord in self._all_ship_coords())
-                else:
-                    row.append(None)
+        Returns:
+            a frozenset of the remaining ships afloat.
+        """
+        return self._afloat
 
-            matrix.append(row)
+    def consistent_placements(self, ship: Ship) -> Iterator[tuple[Coord, ...]]:
+        """Yield the positions a ship could take, going only on what the
+        opponent player knows about the grid.
 
-        return matrix
-
-    def ships_afloat(self) -> set:
-        """Return the ships that have not yet been sunk.
+        The opponent knows where their shots hit or missed and which ships
+        have been sunk, but not which cells a sunk ship filled. A position is
+        consistent when it doesn't overlap a missed shot, and a ship that has
+        been sunk has no positions left to take. Counting the positions that
+        cover each cell gives the likelihood of a ship being there, which a
+        player can use to choose where to shoot next.
 
+        Args:
+            ship: the ship to find positions for.
         Returns:
-            a set of the remaining ships afloat.
+            an iterator over the positions, each a tuple of coordinates.
         """
-        remaining_ships = set(self.ships.keys())
+        if ship in self._positions and ship not in self._afloat:
+            return
+
+        misses = self._shot_bits & ~self._ship_bits
 
-        for ship, location in self.ships.items():
-            if self.shots.issuperset(set(location)):
-                remaining_ships.remove(ship)
+        try:
+            placements = _PLACEMENTS[ship.size]
+        except KeyError:
+            # Not one of the standard ships
+            placements = _ship_placements(ship.size)
 
-        return remaining_ships
+        for mask in placements:
+            if not mask & misses:
+                yield tuple(_INDEX_TO_COORD[index] for index in _bit_indices(mask))
 
     def _all_ship_coords(self) -> set:
         """Return the union of coordinates taken up by all ships."""
-        return set(itertools.chain(*self.ships.values()))
+        return {_INDEX_TO_COORD[index] for index in _bit_indices(self._ship_bits)}
 
     def __contains__(self, coord: Coord):
-        min_row, min_col = ('A', 1)
-        max_row, max_col = (chr(ord('A') + self.size - 1), self.size)
-
-        return min_row <= coord[0] <= max_row and min_col <= coord[1] <= max_col
+        return coord in _COORD_TO_INDEX
 
     def __str__(self):
         return self.as_matrix()
 
 
+class _Ships(MutableMapping):
+    """The locations of the ships positioned on a grid, as a mapping of
+    each ship to the coordinates it fills.
+
+    Adding a ship positions it on the grid, with the same checks as
+    Grid.add_ship(), and removing a ship takes it off the grid, so that
+    shots are reported against the ships positioned at the time.
+    """
+    __slots__ = ('_grid',)
+
+    def __init__(self, grid: Grid):
+        self._grid = grid
+
+    def __getitem__(self, ship: Ship) -> tuple[Coord, ...]:
+        return self._grid._positions[ship]
+
+    def __setitem__(self, ship: Ship, coords: Sequence[Coord]) -> None:
+        self._grid.add_ship(ship, *coords)
+
+    def __delitem__(self, ship: Ship) -> None:
+        if ship not in self._grid._positions:
+            raise KeyError(ship)
+
+        self._grid._remove_ship(ship)
+
+    def __contains__(self, ship) -> bool:
+        return ship in self._grid._positions
+
+    def __iter__(self) -> Iterator[Ship]:
+        return iter(self._grid._positions)
+
+    def __len__(self) -> int:
+        return len(self._grid._positions)
+
+    def __repr__(self):
+        return repr(self._grid._positions)
+
+
+class _Shots(MutableSet):
+    """The shots received by a grid, as a set of coordinates.
+
+    The shots are held in the grid's bitmask, so adding and removing
+    coordinates updates the hits and sinkings the grid reports in step,
+    as receiving and taking back the shots would.
+    """
+    __slots__ = ('_grid',)
+
+    def __init__(self, grid: Grid):
+        self._grid = grid
+
+    @classmethod
+    def _from_iterable(cls, coords):
+        # Set operations such as '&' and '|' return plain sets.
+        return set(coords)
+
+    def __contains__(self, coord) -> bool:
+        index = _COORD_TO_INDEX.get(coord)
+        return index is not None and bool(self._grid._shot_bits >> index & 1)
+
+    def __iter__(self) -> Iterator[Coord]:
+        return (_INDEX_TO_COORD[index] for index in _bit_indices(self._grid._shot_bits))
+
+    def __len__(self) -> int:
+        return bin(self._grid._shot_bits).count('1')
+
+    def add(self, coord: Coord) -> None:
+        """Add a shot, unless it has already been made.
+
+        Raises:
+            InvalidCoordinate: if the coordinate is off the grid.
+        """
+        index = _COORD_TO_INDEX.get(coord)
+
+        if index is None:
+            raise InvalidCoordinate(f'Invalid grid coordinate {coord}')
+
+        if not self._grid._shot_bits >> index & 1:
+            self._grid._receive_shot(index)
+
+    def discard(self, coord: Coord) -> None:
+        """Remove a shot, if it has been made."""
+        if coord in self:
+            self._grid._remove_shot(_COORD_TO_INDEX[coord])
+
+    def update(self, *others: Iterable[Coord]) -> None:
+        """Add the shots from each of the iterables."""
+        for coords in others:
+            for coord in coords:
+                self.add(coord)
+
+    def __repr__(self):
+        return f'{{{", ".join(map(repr, self))}}}' if self else 'set()'
+
+
 class InvalidCoordinate(Exception):
     """Indicates that a coordinate is not valid on the grid."""
 
@@ -363,20 +574,39 @@ class Ship:
 
     Battleships have a name and a size which determines how many grid
     spaces they take up.
+
+    Ships are interned: creating a ship with the same name and size as an
+    existing ship returns the existing instance. This allows ships to
+    compare and hash by identity. As instances are shared, a ship's name
+    and size can't be changed once it has been created.
     """
+    __slots__ = ('name', 'size')
 
-    def __init__(self, name: str, size: int):
-        self.name = name
-        # The number of grid spaces this ship uses
-        self.size = size
+    # The ships created so far, keyed by name and size.
+    _instances: dict[tuple[str, int], Ship] = {}
 
-    def __eq__(self, other: Ship) -> bool:
-        if not isinstance(other, Ship):
-            return False
-        return self.name == other.name and self.size == other.size
+    def __new__(cls, name: str, size: int):
+        try:
+            return cls._instances[name, size]
+        except KeyError:
+            ship = cls._instances[name, size] = super().__new__(cls)
+            # Set the attributes here rather than in __init__(), which would
+            # reassign them each time the interned instance is returned.
+            object.__setattr__(ship, 'name', name)
+            # The number of grid spaces this ship uses
+            object.__setattr__(ship, 'size', size)
+            return ship
 
-    def __hash__(self):
-        return hash((self.name, self.size))
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Ship attribute '{name}' is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Ship attribute '{name}' is read-only")
+
+    def __reduce__(self):
+        # Copies and unpickled ships are created through __new__(), so
+        # that they resolve to the interned instance.
+        return Ship, (self.name, self.size)
 
     def __str__(self):
         return self.name
@@ -399,3 +629,62 @@ all_ships = {
     battleship,
     carrier
 }
+
+# The number of ships each player must position before shooting starts.
+_NUM_SHIPS = len(all_ships)
+
+
+# Lookups between grid coordinates and their index in the row-major
+# flattened grid, which is how Grid represents coordinates internally.
+_COORD_TO_INDEX: dict[Coord, int] = {
+    (chr(ord('A') + row), col + 1): row * Grid.size + col
+    for row in range(Grid.size)
+    for col in range(Grid.size)
+}
+_INDEX_TO_COORD: tuple[Coord, ...] = tuple(_COORD_TO_INDEX)
+
+# The bitmask with the bit for every coordinate on the grid set.
+_ALL_BITS = (1 << len(_INDEX_TO_COORD)) - 1
+
+
+def _bitmask(indices: Iterable[int]) -> int:
+    """Return a bitmask with the bit at each of the packed coordinates set."""
+    mask = 0
+
+    for index in indices:
+        mask |= 1 << index
+
+    return mask
+
+
+def _bit_indices(mask: int) -> Iterator[int]:
+    """Yield the packed coordinates of the bits set in a bitmask, in order."""
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
+
+
+def _ship_placements(size: int) -> list[int]:
+    """Return every position a ship of the specified size can take on an
+    empty grid, as the bitmasks of the coordinates it would fill."""
+    placements = []
+
+    for row in range(Grid.size):
+        for col in range(Grid.size):
+            start = row * Grid.size + col
+
+            if col + size <= Grid.size:
+                # There's room to position the ship horizontally
+                placements.append(_bitmask(range(start, start + size)))
+
+            if row + size <= Grid.size:
+                # There's room to position the ship vertically
+                placements.append(_bitmask(range(start, start + size * Grid.size, Grid.size)))
+
+    return placements
+
+
+# The positions each size of ship can take, used when the computer
+# positions its ships.
+_PLACEMENTS = {ship.size: _ship_placements(ship.size) for ship in all_ships}
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 import bge
@@ -52,6 +55,21 @@ class TestGame:
         assert len(game.players) == 2
         assert bge.COMPUTER in game.players
 
+    def test_raise_exception_ships_removed_after_shooting(self, game):
+        game.shoot('John', ('A', 1))
+        game.players['John'].ships.pop(bge.submarine)
+
+        with pytest.raises(RuntimeError):
+            game.shoot('John', ('A', 2))
+
+    def test_creates_player2_after_shooting(self, game):
+        game.shoot('Jane', ('A', 1))
+        game.players.pop('Jane')  # Remove existing player 2
+
+        game.shoot('John', ('A', 1))  # Computer will assume player 2
+
+        assert list(game.players) == ['John', bge.COMPUTER]
+
     def test_shoot_hit(self, game):
         hit, *_ = game.shoot('Jane', ('B', 2))
 
@@ -149,6 +167,62 @@ class TestGrid:
         with pytest.raises(bge.InvalidCoordinate):
             grid.add_ship(bge.cruiser, ('A', 1), ('C', 1), ('D', 1))
 
+        with pytest.raises(bge.InvalidCoordinate):
+            grid.add_ship(bge.cruiser, ('A', 1), ('B', 2), ('C', 3))
+
+        with pytest.raises(bge.InvalidCoordinate):
+            grid.add_ship(bge.cruiser, ('A', 9), ('A', 10), ('B', 1))
+
+    def test_add_ship_reposition(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
+
+        grid.add_ship(bge.destroyer, ('C', 1), ('C', 2))
+
+        assert grid.ships[bge.destroyer] == (('C', 1), ('C', 2))
+        assert not grid.receive_shot(('A', 1))
+        assert grid.receive_shot(('C', 1))
+
+    def test_add_ship_reposition_frees_coords(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
+        grid.add_ship(bge.destroyer, ('C', 1), ('C', 2))
+
+        grid.add_ship(bge.cruiser, ('A', 1), ('A', 2), ('A', 3))
+
+        assert grid._all_ship_coords() == {('A', 1), ('A', 2), ('A', 3), ('C', 1), ('C', 2)}
+
+    def test_add_ship_reposition_after_shots(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
+        grid.receive_shot(('A', 1))
+        grid.receive_shot(('A', 2))  # Sinks the destroyer
+        grid.receive_shot(('C', 1))
+
+        grid.add_ship(bge.destroyer, ('C', 1), ('C', 2))
+
+        assert grid.as_matrix()[0][:2] == [False, False]
+        assert grid.as_matrix()[2][:2] == [True, None]
+        assert grid.ships_afloat() == {bge.destroyer}
+
+        grid.receive_shot(('C', 2))
+
+        assert grid.ships_afloat() == set()
+
+    def test_remove_ship(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
+        grid.add_ship(bge.submarine, ('D', 9), ('E', 9), ('F', 9))
+
+        grid.ships.pop(bge.submarine)
+
+        assert grid.ships_afloat() == {bge.destroyer}
+        assert not grid.receive_shot(('D', 9))
+
+        grid.add_ship(bge.cruiser, ('D', 9), ('D', 10), ('D', 8))
+
+        assert grid.as_matrix()[3][8] is True
+
     def test_receive_shot_hit(self):
         grid = bge.Grid()
         grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
@@ -173,6 +247,38 @@ class TestGrid:
         with pytest.raises(bge.InvalidCoordinate):
             grid.receive_shot(('A', 2))
 
+    def test_receive_shot_off_grid(self):
+        grid = bge.Grid()
+
+        with pytest.raises(bge.InvalidCoordinate):
+            grid.receive_shot(('K', 1))
+
+    def test_shots(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('A', 2), ('A', 3))
+        grid.receive_shot(('A', 2))
+        grid.receive_shot(('J', 10))
+
+        assert grid.shots == {('A', 2), ('J', 10)}
+
+    def test_shots_updated(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
+        assert grid.shots == set()
+
+        grid.shots.add(('A', 1))
+        grid.shots.update({('A', 2), ('C', 5)})
+
+        assert grid.shots == {('A', 1), ('A', 2), ('C', 5)}
+        assert grid.as_matrix()[0][:2] == [True, True]
+        assert grid.ships_afloat() == set()
+
+        grid.shots.discard(('A', 2))
+
+        assert ('A', 2) not in grid.shots
+        assert grid.as_matrix()[0][1] is None
+        assert grid.ships_afloat() == {bge.destroyer}
+
     def test_as_matrix(self):
         grid = bge.Grid()
         grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
@@ -208,6 +314,15 @@ class TestGrid:
             [None, None, None, None, False, None, None, None, None, True],   # J
         ]
 
+    def test_as_matrix_returns_copy(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
+        grid.receive_shot(('A', 1))
+
+        grid.as_matrix()[0][0] = None
+
+        assert grid.as_matrix()[0][0] is True
+
     def test_ships_afloat(self):
         grid = bge.Grid()
         grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
@@ -221,6 +336,27 @@ class TestGrid:
 
         assert grid.ships_afloat() == {bge.destroyer}
 
+    def test_consistent_placements(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.destroyer, ('C', 1), ('C', 2))
+        grid.add_ship(bge.cruiser, ('C', 3), ('C', 4), ('C', 5))
+        grid.receive_shot(('A', 1))  # Miss
+        grid.receive_shot(('C', 1))  # Hit
+        grid.receive_shot(('C', 2))  # Hit, sinks the destroyer
+        grid.receive_shot(('C', 3))  # Hit
+
+        placements = list(grid.consistent_placements(bge.cruiser))
+
+        assert (('A', 2), ('A', 3), ('A', 4)) in placements
+        assert (('C', 2), ('C', 3), ('C', 4)) in placements  # Overlaps hits, which could be the cruiser's
+        assert (('A', 1), ('B', 1), ('C', 1)) not in placements  # Overlaps the miss
+        assert not list(grid.consistent_placements(bge.destroyer))  # Sunk
+
+    def test_consistent_placements_non_standard_ship(self):
+        grid = bge.Grid()
+
+        assert len(list(grid.consistent_placements(bge.Ship('Frigate', 6)))) == 100
+
     def test_all_ship_coords(self):
         grid = bge.Grid()
         grid.add_ship(bge.destroyer, ('A', 1), ('A', 2))
@@ -234,6 +370,14 @@ class TestGrid:
             ('F', 9),
         }
 
+    def test_copy_and_pickle(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.cruiser, ('J', 8), ('J', 9), ('J', 10))
+
+        for restored in copy.deepcopy(grid), pickle.loads(pickle.dumps(grid)):
+            assert bge.cruiser in restored.ships
+            assert restored.receive_shot(('J', 9))
+
     def test_contains(self):
         grid = bge.Grid()
 
@@ -243,6 +387,7 @@ class TestGrid:
 
         assert ('J', 11) not in grid
         assert ('K', 1) not in grid
+        assert ('AA', 1) not in grid
 
 
 class TestShip:
@@ -250,4 +395,24 @@ class TestShip:
     def test_ship_equality(self):
         assert bge.cruiser == bge.cruiser
         assert bge.cruiser == bge.Ship('Cruiser', 3)
+        assert bge.cruiser is bge.Ship('Cruiser', 3)
         assert not bge.cruiser == bge.carrier
+
+    def test_ship_read_only(self):
+        ship = bge.Ship('Cruiser', 3)
+
+        with pytest.raises(AttributeError):
+            ship.size = 4
+
+        with pytest.raises(AttributeError):
+            ship.name = 'Frigate'
+
+        assert bge.cruiser.name == 'Cruiser'
+        assert bge.cruiser.size == 3
+
+    def test_ship_as_key(self):
+        grid = bge.Grid()
+        grid.add_ship(bge.cruiser, ('J', 8), ('J', 9), ('J', 10))
+
+        assert bge.Ship('Cruiser', 3) in grid.ships
+        assert bge.Ship('Cruiser', 4) not in grid.ships